@@ -5,12 +5,13 @@ The datasets are defined as dataset dataclasses.
 Each dataset dataclass contains information about the dataset, such as the dataset name, the phases and annotations provided in the source dataset.
 It also contains information about how to translate source labels and masks into UMIE format.
 """
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+from functools import cached_property
 
 from config import labels, masks
 
 
-@dataclass
+@dataclass(frozen=True)
 class MaskColor:
     """A class for storing information about how to recolor a given mask from the source color to the target color."""
 
@@ -18,7 +19,7 @@ class MaskColor:
     target_color: int
 
 
-@dataclass
+@dataclass(frozen=True)
 class DatasetArgs:
     """This class represents required configuration information about each dataset."""
 
@@ -34,6 +35,11 @@ class DatasetArgs:
         default_factory=dict
     )  # mask name and MaskColor object specifying how to recolor the mask
 
+    @cached_property
+    def args(self) -> dict:
+        """Dataset arguments as a dict passed to pipeline steps, converted once and shared by all pipelines."""
+        return asdict(self)
+
 
 kits23 = DatasetArgs(
     dataset_uid="00",
@@ -2,145 +2,166 @@
 Config file with the paths to the datasets and their parameters.
 
 The user fills in the paths for the datasets they want to transform.
-The dataset with empty source_path is not transformed.
+The dataset with empty source_path, or with empty labels_path or masks_path it requires, is not transformed.
 If the dataset has a labels_path or masks path, it needs to be filled in too in order to transform the dataset.
 Each dataset should have a comment suggesting the name of the source file the path should point to, e.g. # Path to kits23.json.
+Pipelines are referenced by class name and imported only for datasets with a source_path, so unused pipelines are never loaded.
+Optional PipelineArgs, e.g. num_workers, cache_labels or output_backend, are changed per dataset in pipeline_args_overrides.
 """
-from src.base.pipeline import PathArgs
+from typing import Any
+
+import src.pipelines
+from src.base.pipeline import BasePipeline, PathArgs
 from src.constants import TARGET_PATH
-from src.pipelines import (
-    AlzheimersPipeline,
-    BrainMETSharePipeline,
-    BrainTumorClassificationPipeline,
-    BrainTumorDetectionPipeline,
-    BrainTumorProgressionPipeline,
-    BrainWithIntracranialHemorrhagePipeline,
-    ChestXray14Pipeline,
-    CmmdPipeline,
-    COCAPipeline,
-    CoronaHackPipeline,
-    COVID19DetectionPipeline,
-    CtOrgPipeline,
-    FindingAndMeasuringLungsPipeline,
-    KITS23Pipeline,
-    KneeOsteoarthritisPipeline,
-    LidcIdriPipeline,
-    LITSPipeline,
-)
 
-datasets = [
-    KITS23Pipeline(
-        path_args=PathArgs(
+dataset_paths: list[tuple[str, PathArgs]] = [
+    (
+        "KITS23Pipeline",
+        PathArgs(
             source_path="",  # Path to the "dataset" directory in KITS23 repo
             masks_path="",  # Path to the "dataset" directory in KITS23 repo
             target_path=TARGET_PATH,
             labels_path="",  # Path to kits23.json
         ),
     ),
-    CoronaHackPipeline(
-        path_args=PathArgs(
+    (
+        "CoronaHackPipeline",
+        PathArgs(
             source_path="",
             target_path=TARGET_PATH,
             labels_path="",  # Path to Chest_xray_Corona_Metadata.csv
         ),
     ),
-    AlzheimersPipeline(
-        path_args=PathArgs(
+    (
+        "AlzheimersPipeline",
+        PathArgs(
             source_path="",  # Path to archive directory from kaggle
             target_path=TARGET_PATH,
         ),
     ),
-    BrainTumorClassificationPipeline(
-        path_args=PathArgs(
+    (
+        "BrainTumorClassificationPipeline",
+        PathArgs(
             source_path="",
             target_path=TARGET_PATH,
         ),
     ),
-    COVID19DetectionPipeline(
-        path_args=PathArgs(
+    (
+        "COVID19DetectionPipeline",
+        PathArgs(
             source_path="",
             target_path=TARGET_PATH,
         ),
     ),
-    FindingAndMeasuringLungsPipeline(
-        path_args=PathArgs(
+    (
+        "FindingAndMeasuringLungsPipeline",
+        PathArgs(
             source_path="",  # Path to 2d_images directory
             target_path=TARGET_PATH,
             masks_path="",  # Path to 2d_masks directory
         ),
     ),
-    BrainWithIntracranialHemorrhagePipeline(
-        path_args=PathArgs(
+    (
+        "BrainWithIntracranialHemorrhagePipeline",
+        PathArgs(
             source_path="",
             target_path=TARGET_PATH,
             masks_path="",  # same as source path
         ),
     ),
-    LITSPipeline(
-        path_args=PathArgs(
+    (
+        "LITSPipeline",
+        PathArgs(
             source_path="",
             target_path=TARGET_PATH,
             masks_path="",  # same as source_path
         ),
     ),
-    BrainTumorDetectionPipeline(
-        path_args=PathArgs(
+    (
+        "BrainTumorDetectionPipeline",
+        PathArgs(
             source_path="",
             target_path=TARGET_PATH,
         ),
     ),
-    KneeOsteoarthritisPipeline(
-        path_args=PathArgs(
+    (
+        "KneeOsteoarthritisPipeline",
+        PathArgs(
             source_path="",
             target_path=TARGET_PATH,
         ),
     ),
-    BrainTumorProgressionPipeline(
-        path_args=PathArgs(
+    (
+        "BrainTumorProgressionPipeline",
+        PathArgs(
             source_path="",
             target_path=TARGET_PATH,
             masks_path="",
-        )
+        ),
     ),
-    ChestXray14Pipeline(
-        path_args=PathArgs(
+    (
+        "ChestXray14Pipeline",
+        PathArgs(
             source_path="",  # path to images/
             target_path=TARGET_PATH,
             labels_path="",  # Path to Data_Entry_2017_v2020.csv
         ),
     ),
-    COCAPipeline(
-        path_args=PathArgs(
+    (
+        "COCAPipeline",
+        PathArgs(
             source_path="",  # Path to Gated_release_final/patient
             target_path=TARGET_PATH,
             masks_path="",  # Path to Gated_release_final/calcium_xml
         ),
     ),
-    BrainMETSharePipeline(
-        path_args=PathArgs(
+    (
+        "BrainMETSharePipeline",
+        PathArgs(
             source_path="",
             target_path=TARGET_PATH,
         ),
     ),
-    CtOrgPipeline(
-        path_args=PathArgs(
+    (
+        "CtOrgPipeline",
+        PathArgs(
             source_path="",
             target_path=TARGET_PATH,
             masks_path="",
         ),
     ),
-    LidcIdriPipeline(
-        path_args=PathArgs(
+    (
+        "LidcIdriPipeline",
+        PathArgs(
             source_path="",  # Path to LIDC-IDRI/ directory
             target_path=TARGET_PATH,
             masks_path="",  # Path to extracted LIDC-XML-only/ directory (from LIDC-XML-only.zip)
         ),
     ),
-    CmmdPipeline(
-        path_args=PathArgs(
+    (
+        "CmmdPipeline",
+        PathArgs(
             source_path="",  # Path to 'manifest-{xxxxxxxxxxxxx}/CMMD' folder
             target_path=TARGET_PATH,
             labels_path="",  # Path to 'CMMD_clinicaldata_revision.xlsx' file
         ),
     ),
 ]
+
+# PipelineArgs fields replaced for the given pipeline, e.g.
+# "ChestXray14Pipeline": {"num_workers": 8, "cache_labels": True, "output_backend": "webdataset"},
+pipeline_args_overrides: dict[str, dict[str, Any]] = {}
+
+
+def load_pipeline(pipeline_name: str) -> type[BasePipeline]:
+    """Import the pipeline class with the given name."""
+    return getattr(src.pipelines, pipeline_name)
+
+
+datasets = [
+    load_pipeline(pipeline_name)(
+        path_args=path_args, pipeline_args_overrides=pipeline_args_overrides.get(pipeline_name, {})
+    )
+    for pipeline_name, path_args in dataset_paths
+    if path_args.is_filled_in()
+]
@@ -1,21 +1,22 @@
 """Main script to run dataset preprocessing pipelines."""
 
-from config.runner_config import datasets
+from config.runner_config import dataset_paths, datasets
 
-for dataset in datasets:
+for pipeline_name, path_args in dataset_paths:
     # Check whether source_path is defined
-    if not dataset.args["source_path"]:
-        print(f"{dataset.name} skipped, as no source path found.")
-    elif "labels_path" in dataset.args.keys() and dataset.args["labels_path"] == "":
+    if not path_args.source_path:
+        print(f"{pipeline_name} skipped, as no source path found.")
+    elif path_args.labels_path == "":
         print(
-            f"{dataset.name} skipped, as no labels path found. This dataset requires labels path to extract annotations."
+            f"{pipeline_name} skipped, as no labels path found. This dataset requires labels path to extract annotations."
         )
-    elif "masks_path" in dataset.args.keys() and dataset.args["masks_path"] == "":
+    elif path_args.masks_path == "":
         print(
-            f"{dataset.name} skipped, as no masks path found. This dataset requires masks path to extract annotations."
+            f"{pipeline_name} skipped, as no masks path found. This dataset requires masks path to extract annotations."
         )
-    else:
-        print(dataset.name)
-        pipeline = dataset.pipeline
-        pipeline.transform(dataset.args["source_path"])
-        print(f"{dataset.name} done.")
+
+for dataset in datasets:
+    print(dataset.name)
+    pipeline = dataset.pipeline
+    pipeline.transform(dataset.args["source_path"])
+    print(f"{dataset.name} done.")
@@ -4,10 +4,26 @@ This module contains the definition of the BaseIdExtractor class.
 The BaseIdExtractor class is an abstract base class for extraction of information from image path.
 It provides a default implementation as well as helper methods for its children.
 """
+import os
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=None)
+def _get_parent_dir(dir_path: str, parent_dir_level: int, include_path: bool) -> str:
+    """Get the parent directory of a directory, cached as many images share the same directory."""
+    output_path = Path(dir_path)
+
+    for _ in range(parent_dir_level):
+        output_path = output_path.parent
+
+    if not include_path:
+        return output_path.stem
+
+    return str(output_path)
+
+
 class BaseIdExtractor(ABC):
     """
     Base class for ID extractors.
@@ -73,12 +89,8 @@ class BaseIdExtractor(ABC):
         Returns:
             str: The parent directory path (or its base name if `include_path` is False) at the specified level.
         """
-        output_path = Path(img_path)
-
-        for _ in range(abs(parent_dir_level)):
-            output_path = output_path.parent
-
-        if not include_path:
-            return output_path.stem
+        if parent_dir_level == 0:
+            return Path(img_path).stem if not include_path else str(img_path)
 
-        return str(output_path)
+        # The first level up is the directory of the file, the remaining levels are resolved from it
+        return _get_parent_dir(os.path.dirname(img_path), abs(parent_dir_level) - 1, include_path)
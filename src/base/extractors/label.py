@@ -8,12 +8,24 @@ Label extractors should implement the _extract method to extract the label from
 There is no default implementation of the _extract method, so it must be implemented in the derived class.
 """
 
+import hashlib
+import os
+import pickle
+import tempfile
 from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional
+
+from src.constants import CACHE_PATH
+
+LABELS_CACHE_VERSION = 1  # bump when the format of cached labels changes
+_parsed_labels_files: dict[tuple, Any] = {}  # parsed labels files shared by extractors created in the same process
 
 
 class BaseLabelExtractor(ABC):
     """Base class for constructing a label extractor for an individual dataset."""
 
+    batched: bool = False  # if True, AddLabels extracts labels of all images in a single loop instead of using threads
+
     def __init__(self, labels: dict):
         """Initialize the BaseLabelExtractor class."""
         self.labels = labels
@@ -42,3 +54,69 @@ class BaseLabelExtractor(ABC):
             list: The extracted label.
         """
         raise NotImplementedError("The method _extract must be implemented in the derived class.")
+
+    @classmethod
+    def _read_once(
+        cls, read: Callable[[os.PathLike], Any], labels_path: os.PathLike, dataset_name: Optional[str] = None
+    ) -> Any:
+        """
+        Parse the labels file once per process, parsing it again only if the file changed.
+
+        The parsed labels are shared by all extractors reading the same file, so they must not be modified.
+
+        Args:
+            read (Callable[[os.PathLike], Any]): Function parsing the labels file.
+            labels_path (os.PathLike): Path to the source labels file.
+            dataset_name (Optional[str]): Name of the dataset. If given, the parsed labels are also cached on disk.
+
+        Returns:
+            Any: The parsed labels.
+        """
+        stat = os.stat(labels_path)
+        key = (read, os.path.abspath(labels_path), stat.st_mtime_ns, stat.st_size)
+        if key not in _parsed_labels_files:
+            if dataset_name is None:
+                _parsed_labels_files[key] = read(labels_path)
+            else:
+                _parsed_labels_files[key] = cls._load_cached(dataset_name, labels_path, read)
+        return _parsed_labels_files[key]
+
+    @staticmethod
+    def _load_cached(dataset_name: str, labels_path: os.PathLike, read: Callable[[os.PathLike], Any]) -> Any:
+        """
+        Load parsed labels from the disk cache, parsing and storing them if the labels file changed.
+
+        Args:
+            dataset_name (str): Name of the dataset, used as the cache subdirectory.
+            labels_path (os.PathLike): Path to the source labels file.
+            read (Callable[[os.PathLike], Any]): Function parsing the labels file, called on cache miss.
+
+        Returns:
+            Any: The parsed labels.
+        """
+        stat = os.stat(labels_path)
+        # The parsing function is part of the key, so entries written by a changed parser are not reused
+        key = (
+            f"{LABELS_CACHE_VERSION}:{read.__module__}.{read.__qualname__}:"
+            f"{os.path.abspath(labels_path)}:{stat.st_mtime_ns}:{stat.st_size}"
+        )
+        cache_path = os.path.join(CACHE_PATH, dataset_name, f"labels_{hashlib.sha1(key.encode()).hexdigest()}.pkl")
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, "rb") as f:
+                    return pickle.load(f)
+            except (EOFError, pickle.UnpicklingError):
+                print(f"Labels cache {cache_path} is corrupted, parsing the labels file again.")
+
+        parsed_labels = read(labels_path)
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # Written to a temporary file first, so that concurrent runs never read a partially written cache
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(parsed_labels, f)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return parsed_labels
@@ -8,9 +8,10 @@ The pipeline is constructed from the steps and arguments passed to the pipeline.
 The pipeline is used to process the dataset and save the processed dataset to the target directory.
 """
 
+import importlib
 from abc import abstractmethod
-from dataclasses import asdict, dataclass
-from typing import Callable, Optional
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, Callable, Optional
 
 from sklearn.pipeline import Pipeline
 
@@ -26,6 +27,13 @@ from base.step import BaseStep
 from config.dataset_config import DatasetArgs
 from src.constants import IMG_FOLDER_NAME, MASK_FOLDER_NAME
 
+# Names of steps from the steps module appended to the pipeline to write the output in a given backend
+# Steps are imported only when the pipeline is created, so the base module does not depend on any backend
+OUTPUT_BACKEND_STEPS: dict[str, tuple] = {
+    "png": (),
+    "webdataset": (("create_webdataset_shards", "CreateWebDatasetShards"),),
+}
+
 
 @dataclass
 class PathArgs:
@@ -36,6 +44,13 @@ class PathArgs:
     labels_path: Optional[str] = None  # path to the labels file if it is required
     masks_path: Optional[str] = None  # path to the source masks file if it is required
 
+    def is_filled_in(self) -> bool:
+        """Check if the source path and all paths required by the dataset are filled in.
+
+        Empty string marks a path that is required but not filled in, None marks a path that is not required.
+        """
+        return bool(self.source_path) and self.labels_path != "" and self.masks_path != ""
+
 
 @dataclass
 class PipelineArgs:
@@ -73,6 +88,15 @@ class PipelineArgs:
     ] = None  # dict including mask selector and its meaning for each mask, used when there are multiple masks and each mask has a different selector
     xml_mask_creator: Optional[BaseXmlMaskCreator] = None  # function to create masks from xml files
     dicom_mapping_attribute: Optional[str] = None  # dicom attribute to map paths to
+    num_workers: Optional[int] = None  # number of threads used by steps processing files concurrently
+    # if True, the parsed labels file is stored on disk and reused across runs (only used by ChestX-ray14)
+    cache_labels: bool = False
+    # "png" outputs a directory of png files. "webdataset" writes the same png directory and then packs it into tar
+    # shards for readers, so it adds write I/O and the png files are kept, as they are referenced by the jsonl file
+    output_backend: str = "png"
+    # if True, jpg source images and masks are converted to png while copied to the target directory, used by
+    # pipelines without the ConvertJpg2Png step. Otherwise jpg files are copied byte for byte
+    convert_jpg_on_copy: bool = False
 
 
 @dataclass  # type: ignore[misc]
@@ -84,10 +108,17 @@ class BasePipeline:
     name: str  # name of the dataset
     pipeline_args: PipelineArgs  # arguments passed to sklearn pipeline required to process a specific dataset # defined in config
     steps: tuple[tuple[str, BaseStep]]
+    # PipelineArgs fields replaced for this run, e.g. {"output_backend": "webdataset"}, set per dataset in runner_config
+    pipeline_args_overrides: dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         """Prepare args for the pipeline."""
-        self.args: dict = dict(**asdict(self.path_args), **asdict(self.dataset_args))
+        if self.pipeline_args_overrides:
+            self.pipeline_args = replace(self.pipeline_args, **self.pipeline_args_overrides)
+        output_backend = self.pipeline_args.output_backend
+        if output_backend not in OUTPUT_BACKEND_STEPS:
+            raise ValueError(f"Output backend {output_backend} not in {list(OUTPUT_BACKEND_STEPS)}.")
+        self.args: dict = dict(**asdict(self.path_args), **self.dataset_args.args)
 
         # Run prepare_pipeline only if source path exists.
         if self.args["source_path"]:
@@ -97,8 +128,14 @@ class BasePipeline:
     def pipeline(self) -> Pipeline:
         """Create a pipeline based on the steps and args."""
         args = self.args
+        steps_module = importlib.import_module("steps")
+        backend_steps = tuple(
+            (step_name, getattr(steps_module, step_class))
+            for step_name, step_class in OUTPUT_BACKEND_STEPS[self.pipeline_args.output_backend]
+        )
+        steps = self.steps + backend_steps
         # Create pipeline and pass args to each step
-        return Pipeline(steps=[(step[0], step[1](**args)) for step in self.steps])
+        return Pipeline(steps=[(step[0], step[1](**args)) for step in steps])
 
     @abstractmethod
     def prepare_pipeline(self) -> None:
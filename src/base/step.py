@@ -1,17 +1,26 @@
 """Change img ids to match the format of the rest of the dataset."""
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import PureWindowsPath
-from typing import Callable, Optional
+from typing import Callable, Iterable, Optional
 
+import cv2
 import numpy as np
+from PIL import Image
 from sklearn.base import TransformerMixin
+from tqdm import tqdm
 
 from base.creators.xml_mask import BaseXmlMaskCreator
 from base.extractors.img_id import BaseImgIdExtractor
 from base.selectors.img_selector import BaseImageSelector
 from base.selectors.mask_selector import BaseMaskSelector
 from config.dataset_config import MaskColor
-from constants import IMG_FOLDER_NAME, MASK_FOLDER_NAME
+from constants import IMG_FOLDER_NAME, JPG_EXTENSIONS, MASK_FOLDER_NAME
+
+# Steps already process files in a pool of threads (see map_in_threads), so OpenCV's own threading would oversubscribe the CPU
+cv2.setNumThreads(1)
+cv2.ocl.setUseOpenCL(False)
 
 
 class BaseStep(TransformerMixin):
@@ -47,6 +56,10 @@ class BaseStep(TransformerMixin):
         masks_path: Optional[str] = None,  #
         xml_mask_creator: Optional[BaseXmlMaskCreator] = None,  # function to create masks from xml files
         dicom_mapping_attribute: Optional[str] = None,  # dicom attribute to map paths to
+        num_workers: Optional[int] = None,  # number of threads used to process files concurrently
+        cache_labels: bool = False,  # if True, the parsed labels file is cached on disk (only used by ChestX-ray14)
+        output_backend: str = "png",  # format of the output dataset
+        convert_jpg_on_copy: bool = False,  # if True, jpg source files are converted to png when copied
     ):
         """
         Initialize a Step object.
@@ -78,6 +91,10 @@ class BaseStep(TransformerMixin):
             masks (dict[str, MaskColor], optional): Dictionary containing masks. Defaults to {}.
             xml_mask_creator (BaseXmlMaskCreator, optional): Function to create masks from xml files. Defaults to None.
             dicom_mapping_attribute (str, optional): Dicom attribute to map paths to. Defaults to None.
+            num_workers (Optional[int], optional): Number of threads used to process files concurrently. Defaults to twice the number of CPUs.
+            cache_labels (bool, optional): If True, the parsed labels file is cached on disk, only used by ChestX-ray14. Defaults to False.
+            output_backend (str, optional): Format of the output dataset, "png" or "webdataset" (png files packed into tar shards). Defaults to "png".
+            convert_jpg_on_copy (bool, optional): If True, jpg source files are converted to png when copied. Defaults to False.
         """
         self.target_path = target_path
         self.dataset_name = dataset_name
@@ -111,6 +128,10 @@ class BaseStep(TransformerMixin):
         )
         self.xml_mask_creator = xml_mask_creator
         self.dicom_mapping_attribute = dicom_mapping_attribute
+        self.num_workers = num_workers or (os.cpu_count() or 1) * 2
+        self.cache_labels = cache_labels
+        self.output_backend = output_backend
+        self.convert_jpg_on_copy = convert_jpg_on_copy
 
     def transform(
         self,
@@ -123,6 +144,37 @@ class BaseStep(TransformerMixin):
         """
         raise NotImplementedError("This method should be implemented in the derived class.")
 
+    def map_in_threads(self, func: Callable, items: Iterable) -> list:
+        """Apply the function to every item using a pool of threads.
+
+        Filesystem and image decoding calls release the GIL, so I/O bound steps process files concurrently.
+
+        Args:
+            func (Callable): Function to apply to each item.
+            items (Iterable): Items to process, usually file paths.
+
+        Returns:
+            list: Results of the function in the order of the items.
+        """
+        items = list(items)
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            return list(tqdm(executor.map(func, items), total=len(items)))
+
+    def copy_as_png(self, src_path: str, dst_path: str) -> None:
+        """Copy the file to the target path, converting jpg images to png on the way.
+
+        Jpg images are converted only if convert_jpg_on_copy is set, otherwise every file is copied byte for byte.
+        Converting while copying avoids writing temporary png files to the source directory.
+
+        Args:
+            src_path (str): Path to the source file.
+            dst_path (str): Path to the target file.
+        """
+        if self.convert_jpg_on_copy and src_path.endswith(JPG_EXTENSIONS):
+            Image.open(src_path).save(dst_path, format="png")
+        else:
+            shutil.copy2(src_path, dst_path)
+
     def get_umie_id(self, img_path: str) -> str:
         """Create a unique identifier for the image.
 
@@ -1,6 +1,10 @@
 """Constants used in the project."""
+import os
 
 IMG_FOLDER_NAME = "Images"  # name of the folder with images in each target dataset
 MASK_FOLDER_NAME = "Masks"  # name of the folder with masks in each target dataset
+SHARDS_FOLDER_NAME = "Shards"  # name of the folder with WebDataset shards in each target dataset
+JPG_EXTENSIONS = (".jpg", ".jpeg", ".JPG")  # extensions of source images converted to PNG when copied to the target
 
 TARGET_PATH = "./data/"  # name of the folder, where processed outputs will be placed
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "umie_datasets")  # folder for persistent label caches
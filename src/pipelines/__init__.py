@@ -18,21 +18,61 @@ The pipelines included in this module are:
 - KITS23Pipeline
 - KneeOsteoarthritisPipeline
 - LITSPipeline
+
+Pipeline classes are imported lazily on first access, so using one pipeline does not load the dependencies of all others.
 """
-from .alzheimers import AlzheimersPipeline
-from .brain_met_share import BrainMETSharePipeline
-from .brain_tumor_classification import BrainTumorClassificationPipeline
-from .brain_tumor_detection import BrainTumorDetectionPipeline
-from .brain_tumor_progression import BrainTumorProgressionPipeline
-from .brain_with_intracranial_hemorrhage import BrainWithIntracranialHemorrhagePipeline
-from .chest_xray14 import ChestXray14Pipeline
-from .cmmd import CmmdPipeline
-from .coca import COCAPipeline
-from .coronahack import CoronaHackPipeline
-from .covid19_detection import COVID19DetectionPipeline
-from .ct_org import CtOrgPipeline
-from .finding_and_measuring_lungs import FindingAndMeasuringLungsPipeline
-from .kits23 import KITS23Pipeline
-from .knee_osteoarthritis import KneeOsteoarthritisPipeline
-from .lidc_idri import LidcIdriPipeline
-from .lits import LITSPipeline
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .alzheimers import AlzheimersPipeline
+    from .brain_met_share import BrainMETSharePipeline
+    from .brain_tumor_classification import BrainTumorClassificationPipeline
+    from .brain_tumor_detection import BrainTumorDetectionPipeline
+    from .brain_tumor_progression import BrainTumorProgressionPipeline
+    from .brain_with_intracranial_hemorrhage import (
+        BrainWithIntracranialHemorrhagePipeline,
+    )
+    from .chest_xray14 import ChestXray14Pipeline
+    from .cmmd import CmmdPipeline
+    from .coca import COCAPipeline
+    from .coronahack import CoronaHackPipeline
+    from .covid19_detection import COVID19DetectionPipeline
+    from .ct_org import CtOrgPipeline
+    from .finding_and_measuring_lungs import FindingAndMeasuringLungsPipeline
+    from .kits23 import KITS23Pipeline
+    from .knee_osteoarthritis import KneeOsteoarthritisPipeline
+    from .lidc_idri import LidcIdriPipeline
+    from .lits import LITSPipeline
+
+# Maps pipeline class name to the module defining it
+_PIPELINE_MODULES = {
+    "AlzheimersPipeline": ".alzheimers",
+    "BrainMETSharePipeline": ".brain_met_share",
+    "BrainTumorClassificationPipeline": ".brain_tumor_classification",
+    "BrainTumorDetectionPipeline": ".brain_tumor_detection",
+    "BrainTumorProgressionPipeline": ".brain_tumor_progression",
+    "BrainWithIntracranialHemorrhagePipeline": ".brain_with_intracranial_hemorrhage",
+    "ChestXray14Pipeline": ".chest_xray14",
+    "CmmdPipeline": ".cmmd",
+    "COCAPipeline": ".coca",
+    "CoronaHackPipeline": ".coronahack",
+    "COVID19DetectionPipeline": ".covid19_detection",
+    "CtOrgPipeline": ".ct_org",
+    "FindingAndMeasuringLungsPipeline": ".finding_and_measuring_lungs",
+    "KITS23Pipeline": ".kits23",
+    "KneeOsteoarthritisPipeline": ".knee_osteoarthritis",
+    "LidcIdriPipeline": ".lidc_idri",
+    "LITSPipeline": ".lits",
+}
+
+__all__ = list(_PIPELINE_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the pipeline class on first access."""
+    if name not in _PIPELINE_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    pipeline = getattr(importlib.import_module(_PIPELINE_MODULES[name], __name__), name)
+    globals()[name] = pipeline
+    return pipeline
@@ -119,7 +119,7 @@ class AlzheimersPipeline(BasePipeline):
         ("delete_temp_files", DeleteTempFiles),
         # ("validate_data", ValidateData),
     )
-    dataset_args: DatasetArgs = field(default_factory=lambda: alzheimers)
+    dataset_args: DatasetArgs = field(default=alzheimers)
     pipeline_args: PipelineArgs = field(
         default_factory=lambda: PipelineArgs(
             image_folder_name=IMG_FOLDER_NAME,
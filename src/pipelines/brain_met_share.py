@@ -67,9 +67,7 @@ class BrainMETSharePipeline(BasePipeline):
         ("recolor_masks", RecolorMasks),
         # ("validate_data", ValidateData),
     )
-    dataset_args: DatasetArgs = field(
-        default_factory=lambda: brain_met_share
-    )  # Update default value to use default_factory
+    dataset_args: DatasetArgs = field(default=brain_met_share)
     pipeline_args: PipelineArgs = field(
         default_factory=lambda: PipelineArgs(
             zfill=3,
@@ -113,7 +113,7 @@ class BrainTumorClassificationPipeline(BasePipeline):
         ("delete_temp_files", DeleteTempFiles),
         ("validate_data", ValidateData),
     )
-    dataset_args: DatasetArgs = field(default_factory=lambda: brain_tumor_classification)
+    dataset_args: DatasetArgs = field(default=brain_tumor_classification)
     pipeline_args: PipelineArgs = field(
         default_factory=lambda: PipelineArgs(
             image_folder_name="Images",
@@ -89,7 +89,7 @@ class BrainTumorDetectionPipeline(BasePipeline):
         ("delete_temp_png", DeleteTempPng),
         ("validate_data", ValidateData),
     )
-    dataset_args: DatasetArgs = field(default_factory=lambda: brain_tumor_detection)
+    dataset_args: DatasetArgs = field(default=brain_tumor_detection)
     pipeline_args: PipelineArgs = field(
         default_factory=lambda: PipelineArgs(
             image_folder_name="Images",
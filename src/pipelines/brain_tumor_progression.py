@@ -93,7 +93,7 @@ class BrainTumorProgressionPipeline(BasePipeline):
         ("delete_temp_files", DeleteTempFiles),
         ("validate_data", ValidateData),
     )
-    dataset_args: DatasetArgs = field(default_factory=lambda: brain_tumor_progression)
+    dataset_args: DatasetArgs = field(default=brain_tumor_progression)
     pipeline_args: PipelineArgs = field(
         default_factory=lambda: PipelineArgs(
             zfill=4,
@@ -4,6 +4,7 @@ from dataclasses import asdict, dataclass, field
 from typing import Any
 
 import cv2
+import numpy as np
 
 from base.extractors import (
     BaseImgIdExtractor,
@@ -18,12 +19,10 @@ from config.dataset_config import DatasetArgs, brain_with_intracranial_hemorrhag
 from steps import (
     AddLabels,
     AddUmieIds,
-    ConvertJpg2Png,
     CopyMasks,
     CreateBlankMasks,
     CreateFileTree,
     DeleteTempFiles,
-    DeleteTempPng,
     GetFilePaths,
     MasksToBinaryColors,
     RecolorMasks,
@@ -65,14 +64,28 @@ class LabelExtractor(BaseLabelExtractor):
         """Initialize the extractor."""
         super().__init__(labels)
         self.target_colors = [mask["target_color"] for mask in masks.values()]
+        self._mask_names: dict[str, set[str]] = {}  # mask directory -> names of masks it contains
+
+    def _mask_exists(self, mask_path: str) -> bool:
+        """Check if the mask exists, listing each masks directory only once."""
+        # Masks are created by earlier steps of the pipeline, so the directory is listed lazily on first lookup
+        masks_dir, mask_name = os.path.split(mask_path)
+        if masks_dir not in self._mask_names:
+            self._mask_names[masks_dir] = set(os.listdir(masks_dir)) if os.path.isdir(masks_dir) else set()
+        return mask_name in self._mask_names[masks_dir]
 
     def _extract(self, img_path: str, mask_path: str) -> tuple[list, list]:
         """Extract label from img path."""
         # If there is a mask associated with the image in a source directory, then the label is 'hemorrhage'
-        if os.path.exists(mask_path) and self.target_colors in cv2.imread(mask_path):
-            return self.labels["brain_hemorrhage"], ["brain_hemorrhage"]
-        else:
+        # Blank masks are created only after labels are added, so images without hemorrhage are skipped here
+        # without decoding. Existing masks are always decoded, as small lesions compress to nearly blank file sizes.
+        if not self._mask_exists(mask_path):
             return self.labels["normal"], ["normal"]
+        # Masks are grayscale, so a single channel is enough to look for the target colors
+        mask = cv2.imread(mask_path, cv2.IMREAD_GRAYSCALE)
+        if mask is not None and np.isin(mask, self.target_colors).any():
+            return self.labels["brain_hemorrhage"], ["brain_hemorrhage"]
+        return self.labels["normal"], ["normal"]
 
 
 class ImageSelector(BaseImageSelector):
@@ -80,7 +93,8 @@ class ImageSelector(BaseImageSelector):
 
     def _is_image_file(self, path: str) -> bool:
         """Check if the file is the intended image."""
-        return "." in path
+        # Source images and masks are jpg files, they are converted to png while copied to the target directory
+        return path.endswith(".jpg")
 
 
 class MaskSelector(BaseMaskSelector):
@@ -99,7 +113,6 @@ class BrainWithIntracranialHemorrhagePipeline(BasePipeline):
     steps: tuple = (
         ("get_file_paths", GetFilePaths),
         ("create_file_tree", CreateFileTree),
-        ("convert_jpg2png", ConvertJpg2Png),
         ("copy_masks", CopyMasks),
         ("masks_to_binary_colors", MasksToBinaryColors),
         ("recolor_masks", RecolorMasks),
@@ -109,10 +122,9 @@ class BrainWithIntracranialHemorrhagePipeline(BasePipeline):
         # Recommended to create blank masks because only about 10% images have masks.
         ("create_blank_masks", CreateBlankMasks),
         ("delete_temp_files", DeleteTempFiles),
-        ("delete_temp_png", DeleteTempPng),
         ("validate_data", ValidateData),
     )
-    dataset_args: DatasetArgs = field(default_factory=lambda: brain_with_intracranial_hemorrhage)
+    dataset_args: DatasetArgs = field(default=brain_with_intracranial_hemorrhage)
     pipeline_args: PipelineArgs = field(
         default_factory=lambda: PipelineArgs(
             img_prefix=".",  # prefix of the source image file names
@@ -122,6 +134,7 @@ class BrainWithIntracranialHemorrhagePipeline(BasePipeline):
             study_id_extractor=StudyIdExtractor(),
             img_selector=ImageSelector(),
             mask_selector=MaskSelector(),
+            convert_jpg_on_copy=True,  # source jpg files are converted while copied instead of by ConvertJpg2Png
         )
     )
 
@@ -1,6 +1,7 @@
 """Preprocessing pipeline for ChestX-ray14 dataset."""
 import os
 from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from typing import Any
 
 import pandas as pd
@@ -48,22 +49,46 @@ class StudyIdExtractor(BaseStudyIdExtractor):
 class LabelExtractor(BaseLabelExtractor):
     """Extractor for labels specific to the Chest Xray 14 dataset."""
 
-    def __init__(self, labels: dict[str, str], labels_path: os.PathLike):
+    # Labels are looked up in memory, so a single loop is cheaper than dispatching images to threads
+    batched: bool = True
+
+    def __init__(
+        self,
+        labels: dict[str, str],
+        labels_path: os.PathLike,
+        cache_labels: bool = False,
+        dataset_name: str = "chest_xray14",
+    ):
         """Initialize the extractor."""
         super().__init__(labels)
-        self.source_labels = pd.read_csv(labels_path)[["Image Index", "Finding Labels"]]
+        # Pipelines created again for the same labels file, e.g. in tests, reuse the index parsed before
+        self.index = self._read_once(self._build_index, labels_path, dataset_name if cache_labels else None)
+        # Only a few hundred distinct label combinations exist, so each one is expanded only once
+        self._expand = lru_cache(maxsize=None)(self._expand_labels)
+
+    @staticmethod
+    def _build_index(labels_path: os.PathLike) -> dict[str, str]:
+        """Map image name to its raw "Finding Labels" string for constant time lookups."""
+        # Few distinct label combinations repeat across rows, so the categorical dtype parses and stores each one once
+        source_labels = pd.read_csv(
+            labels_path,
+            usecols=["Image Index", "Finding Labels"],
+            dtype={"Image Index": str, "Finding Labels": "category"},
+        )
+        return dict(zip(source_labels["Image Index"].to_numpy(), source_labels["Finding Labels"].to_numpy()))
 
     def _extract(self, img_path: os.PathLike, *args: Any) -> tuple[list, list]:
         """Extract label from img path."""
-        img_name = os.path.basename(img_path)
-        img_row = self.source_labels.loc[self.source_labels["Image Index"] == img_name]
-        if img_row.empty:
+        raw_labels = self.index.get(os.path.basename(img_path))
+        if raw_labels is None:
             return [], []
-        labels = [label for label in img_row["Finding Labels"].values[0].split("|")]
-        radlex_labels: list = []
-        for label in labels:
-            radlex_labels.extend(self.labels[label])
+        radlex_labels, labels = self._expand(raw_labels)
+        return list(radlex_labels), list(labels)
 
+    def _expand_labels(self, raw_labels: str) -> tuple[tuple, tuple]:
+        """Translate pipe separated source labels into RadLex labels."""
+        labels = tuple(raw_labels.split("|"))
+        radlex_labels = tuple(radlex_label for label in labels for radlex_label in self.labels[label])
         return radlex_labels, labels
 
 
@@ -98,7 +123,7 @@ class ChestXray14Pipeline(BasePipeline):
         ("delete_temp_files", DeleteTempFiles),
         ("validate_data", ValidateData),
     )
-    dataset_args: DatasetArgs = field(default_factory=lambda: chest_xray14)
+    dataset_args: DatasetArgs = field(default=chest_xray14)
     pipeline_args: PipelineArgs = field(
         default_factory=lambda: PipelineArgs(
             zfill=4,
@@ -113,4 +138,6 @@ class ChestXray14Pipeline(BasePipeline):
         """Post initialization actions."""
         # Add dataset specific arguments to the pipeline arguments
         self.args: dict[str, Any] = dict(**self.args, **asdict(self.pipeline_args))
-        self.args["label_extractor"] = LabelExtractor(self.args["labels"], self.args["labels_path"])
+        self.args["label_extractor"] = LabelExtractor(
+            self.args["labels"], self.args["labels_path"], self.args["cache_labels"], self.args["dataset_name"]
+        )
@@ -152,7 +152,7 @@ class CmmdPipeline(BasePipeline):
         ("delete_temp_files", DeleteTempFiles),
         ("validate_data", ValidateData),
     )
-    dataset_args: DatasetArgs = field(default_factory=lambda: cmmd)
+    dataset_args: DatasetArgs = field(default=cmmd)
     pipeline_args: PipelineArgs = field(
         default_factory=lambda: PipelineArgs(
             image_folder_name=IMG_FOLDER_NAME,
@@ -118,7 +118,7 @@ class COCAPipeline(BasePipeline):
         ("delete_temp_png", DeleteTempPng),
         ("validate_data", ValidateData),
     )
-    dataset_args: DatasetArgs = field(default_factory=lambda: coca)
+    dataset_args: DatasetArgs = field(default=coca)
     pipeline_args: PipelineArgs = field(
         default_factory=lambda: PipelineArgs(
             zfill=4,
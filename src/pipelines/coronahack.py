@@ -109,7 +109,7 @@ class CoronaHackPipeline(BasePipeline):
         ("add_labels", AddLabels),
         ("validate_data", ValidateData),
     )
-    dataset_args: DatasetArgs = field(default_factory=lambda: coronahack)
+    dataset_args: DatasetArgs = field(default=coronahack)
     pipeline_args: PipelineArgs = field(
         default_factory=lambda: PipelineArgs(
             zfill=4,
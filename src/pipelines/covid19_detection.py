@@ -109,7 +109,7 @@ class COVID19DetectionPipeline(BasePipeline):
         ("delete_temp_png", DeleteTempPng),
         ("validate_data", ValidateData),
     )
-    dataset_args: DatasetArgs = field(default_factory=lambda: covid19_detection)
+    dataset_args: DatasetArgs = field(default=covid19_detection)
     pipeline_args: PipelineArgs = field(
         default_factory=lambda: PipelineArgs(
             image_folder_name=IMG_FOLDER_NAME,
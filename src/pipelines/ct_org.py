@@ -73,7 +73,7 @@ class CtOrgPipeline(BasePipeline):
         ("delete_temp_png", DeleteTempPng),
         ("validate_data", ValidateData),
     )
-    dataset_args: DatasetArgs = field(default_factory=lambda: dataset_config.ct_org)
+    dataset_args: DatasetArgs = field(default=dataset_config.ct_org)
     pipeline_args: PipelineArgs = field(
         default_factory=lambda: PipelineArgs(
             zfill=2,
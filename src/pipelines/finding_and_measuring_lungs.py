@@ -73,7 +73,7 @@ class FindingAndMeasuringLungsPipeline(BasePipeline):
         ("delete_temp_files", DeleteTempFiles),
         ("validate_data", ValidateData),
     )
-    dataset_args: DatasetArgs = field(default_factory=lambda: finding_and_measuring_lungs)
+    dataset_args: DatasetArgs = field(default=finding_and_measuring_lungs)
     pipeline_args: PipelineArgs = field(
         default_factory=lambda: PipelineArgs(
             image_folder_name=IMG_FOLDER_NAME,
@@ -121,7 +121,7 @@ class KITS23Pipeline(BasePipeline):
         ("delete_temp_png", DeleteTempPng),
         ("validate_data", ValidateData),
     )
-    dataset_args: DatasetArgs = field(default_factory=lambda: kits23)
+    dataset_args: DatasetArgs = field(default=kits23)
     pipeline_args: PipelineArgs = field(
         default_factory=lambda: PipelineArgs(
             zfill=2,
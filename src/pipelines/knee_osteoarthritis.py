@@ -81,7 +81,7 @@ class KneeOsteoarthritisPipeline(BasePipeline):
         ("delete_temp_files", DeleteTempFiles),
         ("validate_data", ValidateData),
     )
-    dataset_args: DatasetArgs = field(default_factory=lambda: knee_osteoarthritis)
+    dataset_args: DatasetArgs = field(default=knee_osteoarthritis)
     pipeline_args: PipelineArgs = field(
         default_factory=lambda: PipelineArgs(
             image_folder_name=IMG_FOLDER_NAME,
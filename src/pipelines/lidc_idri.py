@@ -163,7 +163,7 @@ class LidcIdriPipeline(BasePipeline):
         ("delete_temp_png", DeleteTempPng),
         ("validate_data", ValidateData),
     )
-    dataset_args: DatasetArgs = field(default_factory=lambda: lidc_idri)
+    dataset_args: DatasetArgs = field(default=lidc_idri)
     pipeline_args: PipelineArgs = field(
         default_factory=lambda: PipelineArgs(
             img_id_extractor=ImgIdExtractor(),
@@ -92,7 +92,7 @@ class LITSPipeline(BasePipeline):
         ("validate_data", ValidateData),
     )
 
-    dataset_args: DatasetArgs = field(default_factory=lambda: lits)
+    dataset_args: DatasetArgs = field(default=lits)
     pipeline_args: PipelineArgs = field(
         default_factory=lambda: PipelineArgs(
             img_prefix="volume",  # prefix of the source image file names
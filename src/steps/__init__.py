@@ -18,6 +18,7 @@ from .create_blank_masks import CreateBlankMasks
 from .create_file_to_dcm_attribute_mapping import CreateFileToDcmAttributeMapping
 from .create_file_tree import CreateFileTree
 from .create_masks_from_xml import CreateMasksFromXml
+from .create_webdataset_shards import CreateWebDatasetShards
 from .delete_imgs_with_no_annotations import DeleteImgsWithNoAnnotations
 from .delete_temp_files import DeleteTempFiles
 from .delete_temp_png import DeleteTempPng
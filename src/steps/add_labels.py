@@ -2,10 +2,10 @@
 import glob
 import json
 import os
+from functools import partial
 from typing import Callable, Optional
 
 import jsonlines
-from tqdm import tqdm
 
 from src.base.extractors.img_id import BaseImgIdExtractor
 from src.base.step import BaseStep
@@ -34,8 +34,11 @@ class AddLabels(BaseStep):
             source_paths_dict = None
 
         self.json_updates: dict = {}
-        for img_path in tqdm(X):
-            self.add_labels(img_path, source_paths_dict)
+        if self.label_extractor.batched:
+            for img_path in X:
+                self.add_labels(img_path, source_paths_dict)
+        else:
+            self.map_in_threads(partial(self.add_labels, source_path_dict=source_paths_dict), X)
 
         updated_lines = []
         with jsonlines.open(self.json_path, mode="r") as reader:
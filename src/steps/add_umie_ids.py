@@ -2,7 +2,6 @@
 import glob
 import json
 import os
-import shutil
 from typing import Callable, Optional
 
 import jsonlines
@@ -96,7 +95,7 @@ class AddUmieIds(BaseStep):
             if self.target_path in img_path:
                 os.rename(img_path, umie_path)
             else:
-                shutil.copy2(img_path, umie_path)
+                self.copy_as_png(img_path, umie_path)
 
         umie_mask_path = ""
         if self.mask_folder_name is not None:
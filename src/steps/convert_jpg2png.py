@@ -4,7 +4,6 @@ import os
 from typing import Callable
 
 from PIL import Image
-from tqdm import tqdm
 
 from base.extractors.img_id import BaseImgIdExtractor
 from base.step import BaseStep
@@ -26,18 +25,16 @@ class ConvertJpg2Png(BaseStep):
         """
         print("Converting jpg to png...")
         paths = glob.glob(os.path.join(self.source_path, "**/*.*"), recursive=True)
-        for img_path in tqdm(paths):
-            if img_path.endswith(".jpg") or img_path.endswith(".jpeg") or img_path.endswith(".JPG"):
-                # Convert each jpg or jpeg file to png
-                self.convert_jpg2png(img_path)
+        # Convert each jpg or jpeg file to png
+        jpg_paths = [img_path for img_path in paths if img_path.endswith((".jpg", ".jpeg", ".JPG"))]
+        self.map_in_threads(self.convert_jpg2png, jpg_paths)
 
         root_path = os.path.join(self.target_path, f"{self.dataset_uid}_{self.dataset_name}")
         mask_paths = glob.glob(
             os.path.join(root_path, f"**/{self.mask_folder_name}/*.jpg"), recursive=True
         ) + glob.glob(os.path.join(root_path, f"**/{self.mask_folder_name}/*.jpeg"), recursive=True)
         if mask_paths:
-            for mask_path in tqdm(mask_paths):
-                self.convert_jpg2png(mask_path)
+            self.map_in_threads(self.convert_jpg2png, mask_paths)
         else:
             print("Masks not found.")
 
@@ -2,9 +2,9 @@
 
 import glob
 import os
-import shutil
 
 from base.step import BaseStep
+from constants import JPG_EXTENSIONS
 
 
 class CopyMasks(BaseStep):
@@ -24,27 +24,42 @@ class CopyMasks(BaseStep):
         print("Copying masks...")
         if len(X) == 0:
             raise ValueError("No list of files provided.")
-        mask_paths = glob.glob(os.path.join(self.masks_path, "**/*.png"), recursive=True)
+        # jpg masks are collected only if they are converted to png while copying
+        extensions = (".png", *JPG_EXTENSIONS) if self.convert_jpg_on_copy else (".png",)
+        mask_paths = [
+            mask_path
+            for extension in extensions
+            for mask_path in glob.glob(os.path.join(self.masks_path, f"**/*{extension}"), recursive=True)
+        ]
+        mask_paths = [
+            mask_path
+            for mask_path in mask_paths
+            if os.path.exists(mask_path)
+            and self.segmentation_prefix is not None
+            and self.segmentation_prefix in mask_path
+        ]
+        # Masks from different phase folders can map to the same target, the first found source is copied
+        new_mask_paths: dict[str, str] = {}
         for mask_path in mask_paths:
-            if (
-                os.path.exists(mask_path)
-                and self.segmentation_prefix is not None
-                and self.segmentation_prefix in mask_path
-            ):
-                self.copy_masks(mask_path)
+            for new_path in self.get_new_mask_paths(mask_path):
+                if new_path not in new_mask_paths and not os.path.exists(new_path):
+                    new_mask_paths[new_path] = mask_path
+        self.map_in_threads(lambda paths: self.copy_as_png(*paths), [(src, dst) for dst, src in new_mask_paths.items()])
         return X
 
-    #
-    def copy_masks(self, img_path: str) -> None:
-        """Copy PNG masks to a new folder structure.
+    def get_new_mask_paths(self, img_path: str) -> list:
+        """Get paths the mask is copied to in the new folder structure.
 
         Args:
-            img_path (str): Path to the image.
+            img_path (str): Path to the mask.
+        Returns:
+            list: Paths to the mask in the new folder structure, one for each phase.
         """
+        new_paths: list = []
         img_id = self.img_id_extractor(img_path)
         study_id = self.study_id_extractor(img_path)
         if self.segmentation_prefix not in img_path:
-            return None
+            return new_paths
         if self.mask_prefix is not None and self.mask_selector(img_id):
             img_id = img_id.replace(self.mask_prefix, "")
         for phase_id in self.phases.keys():
@@ -56,6 +71,8 @@ class CopyMasks(BaseStep):
             new_file_name = f"{self.dataset_uid}_{phase_id}_{study_id}_{img_id}"
             if "." not in new_file_name:
                 new_file_name = new_file_name + ".png"
+            elif self.convert_jpg_on_copy and new_file_name.endswith(JPG_EXTENSIONS):
+                new_file_name = os.path.splitext(new_file_name)[0] + ".png"
             new_path = os.path.join(
                 self.target_path,
                 f"{self.dataset_uid}_{self.dataset_name}",
@@ -63,6 +80,5 @@ class CopyMasks(BaseStep):
                 self.mask_folder_name,
                 new_file_name,
             )
-
-            if not os.path.exists(new_path):
-                shutil.copy2(img_path, new_path)
+            new_paths.append(new_path)
+        return new_paths
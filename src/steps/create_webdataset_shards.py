@@ -0,0 +1,65 @@
+"""Pack the output dataset into WebDataset tar shards keyed by UMIE id."""
+import os
+
+import jsonlines
+from tqdm import tqdm
+
+from base.step import BaseStep
+from constants import SHARDS_FOLDER_NAME
+
+SAMPLES_PER_SHARD = 10000  # maximum number of images stored in a single tar shard
+
+
+class CreateWebDatasetShards(BaseStep):
+    """Pack the output images, masks and their metadata into WebDataset tar shards."""
+
+    def transform(
+        self,
+        X: list,  # img_paths
+    ) -> list:
+        """Pack the output images, masks and their metadata into WebDataset tar shards.
+
+        Reading a few large shards instead of one small file per image avoids opening millions of files on clustered filesystems.
+        The shards are written in addition to the png files, which stay in place as the jsonl file references them.
+
+        Args:
+            X (list): List of paths to the images.
+        Returns:
+            list: List of paths to the images.
+        """
+        # Imported here, so that webdataset is loaded only by pipelines using this backend
+        import webdataset as wds
+
+        print("Creating WebDataset shards...")
+        root_path = os.path.join(self.target_path, f"{self.dataset_uid}_{self.dataset_name}")
+        shards_path = os.path.join(root_path, SHARDS_FOLDER_NAME)
+        os.makedirs(shards_path, exist_ok=True)
+        pattern = os.path.join(shards_path, f"{self.dataset_uid}_{self.dataset_name}-%06d.tar")
+
+        with jsonlines.open(self.json_path, mode="r") as reader:
+            with wds.ShardWriter(pattern, maxcount=SAMPLES_PER_SHARD, verbose=0) as sink:
+                for obj in tqdm(reader):
+                    sink.write(self.create_sample(obj))
+        return X
+
+    def create_sample(self, obj: dict) -> dict:
+        """Create a WebDataset sample from the jsonl entry of the image.
+
+        Args:
+            obj (dict): Entry of the image in the dataset jsonl file.
+        Returns:
+            dict: Sample with the encoded image, mask and metadata of the image.
+        """
+        sample = {
+            "__key__": os.path.splitext(obj["umie_id"])[0],
+            "png": self._read_bytes(obj["umie_path"]),
+            "json": obj,
+        }
+        if obj["mask_path"]:
+            sample["mask.png"] = self._read_bytes(obj["mask_path"])
+        return sample
+
+    def _read_bytes(self, path: str) -> bytes:
+        """Read an already encoded file from the target directory."""
+        with open(os.path.join(self.target_path, path), "rb") as f:
+            return f.read()
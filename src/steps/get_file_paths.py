@@ -1,10 +1,33 @@
 """Get file paths of all images from a source directory."""
 
 import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Optional
 
 from base.step import BaseStep
 
+SKIPPED_PREFIXES = (".", "LICENSE")  # hidden and licence files
+SKIPPED_EXTENSIONS = (".csv", ".json", ".xslx", ".yml", ".txt", ".py", ".md")  # metadata files
+
+
+def _scan_dir(dir_path: str) -> tuple[list, list]:
+    """List subdirectories to walk into and file names of a directory, skipping it if it cannot be read like os.walk."""
+    subdirs, filenames = [], []
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    filenames.append(entry.name)
+                elif not entry.is_symlink():
+                    subdirs.append(entry.path)
+    except OSError:
+        pass
+    return subdirs, filenames
+
 
 class GetFilePaths(BaseStep):
     """Get file paths of all images from a source directory."""
@@ -32,17 +55,43 @@ class GetFilePaths(BaseStep):
             file_paths (list): List of paths to the images.
         """
         file_paths = []
-        for root, _, filenames in os.walk(source_path):
+        # Resolve the selector once, as it is called for every file in the dataset
+        img_selector = None if self.mask_prefix is None else self.img_selector
+        for root, filenames in self.walk(source_path):
             for filename in filenames:
-                if filename.startswith("."):
+                if filename.startswith(SKIPPED_PREFIXES) or filename.endswith(SKIPPED_EXTENSIONS):
                     continue
-                if filename.endswith((".csv", ".json", ".xslx", ".yml", ".txt", ".py", ".md")):
-                    continue
-                if filename.startswith("LICENSE"):
-                    continue
-                else:
-                    path = os.path.join(root, filename)
-                    # Verify if file is not a mask
-                    if self.mask_prefix is None or self.img_selector(path):
-                        file_paths.append(path)
+                path = os.path.join(root, filename)
+                # Verify if file is not a mask
+                if img_selector is None or img_selector(path):
+                    file_paths.append(path)
         return file_paths
+
+    def walk(self, source_path: str) -> list:
+        """List all directories of the source directory concurrently, as directory metadata calls are I/O bound.
+
+        Args:
+            source_path (str): Path to the source directory.
+        Returns:
+            list: Tuples of directory path and names of files in it, in the same order as os.walk.
+        """
+        listings: dict[str, tuple[list, list]] = {}
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            pending = {executor.submit(_scan_dir, source_path): source_path}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    dir_path = pending.pop(future)
+                    listings[dir_path] = future.result()
+                    for subdir in listings[dir_path][0]:
+                        pending[executor.submit(_scan_dir, subdir)] = subdir
+
+        # Restore top-down order of os.walk, files of a directory come before files of its subdirectories
+        walked_dirs = []
+        dirs_to_visit = [source_path]
+        while dirs_to_visit:
+            dir_path = dirs_to_visit.pop()
+            subdirs, filenames = listings[dir_path]
+            walked_dirs.append((dir_path, filenames))
+            dirs_to_visit.extend(reversed(subdirs))
+        return walked_dirs
@@ -4,7 +4,6 @@ import os
 from typing import Callable
 
 import cv2
-from tqdm import tqdm
 
 from base.step import BaseStep
 
@@ -23,9 +22,8 @@ class MasksToBinaryColors(BaseStep):
         root_path = os.path.join(self.target_path, f"{self.dataset_uid}_{self.dataset_name}")
         mask_paths = glob.glob(os.path.join(root_path, f"**/{self.mask_folder_name}/*.png"), recursive=True)
 
-        for mask_path in tqdm(mask_paths):
-            if os.path.exists(mask_path):
-                self.scale_to_2_colors(mask_path)
+        mask_paths = [mask_path for mask_path in mask_paths if os.path.exists(mask_path)]
+        self.map_in_threads(self.scale_to_2_colors, mask_paths)
         return X
 
     def scale_to_2_colors(self, mask_path: str) -> None:
@@ -2,6 +2,7 @@
 
 import glob
 import os
+from functools import cached_property
 
 import cv2
 import numpy as np
@@ -26,9 +27,8 @@ class RecolorMasks(BaseStep):
         root_path = os.path.join(self.target_path, f"{self.dataset_uid}_{self.dataset_name}")
         mask_paths = glob.glob(os.path.join(root_path, f"**/{self.mask_folder_name}/*.png"), recursive=True)
         print("Recoloring masks...")
-        for mask_path in mask_paths:
-            if os.path.exists(mask_path):
-                self.recolor_masks(mask_path)
+        mask_paths = [mask_path for mask_path in mask_paths if os.path.exists(mask_path)]
+        self.map_in_threads(self.recolor_masks, mask_paths)
         return X
 
     def recolor_masks(self, mask_path: str) -> None:
@@ -38,12 +38,15 @@ class RecolorMasks(BaseStep):
             mask_path (str): Path to the mask.
         """
         mask = cv2.imread(mask_path)
-        # changing pixel values
-        # add and then subtract factor of 255 to prevent changing color of the same area more than once
-        mask = mask.astype("uint16")
-        for mask_color in self.masks.values():
-            np.place(mask, mask == mask_color["source_color"], mask_color["target_color"] + 255)
-
-        mask[mask > 255] -= 255
-        mask = mask.astype("uint8")
+        # changing pixel values with a single lookup, so the same area never changes color more than once
+        mask = cv2.LUT(mask, self.color_lut)
         cv2.imwrite(mask_path, mask)
+
+    @cached_property
+    def color_lut(self) -> np.ndarray:
+        """Lookup table mapping each pixel value to its target color, identity for colors not in the config."""
+        color_lut = np.arange(256, dtype=np.uint8)
+        # reversed, so that the first config entry wins if a source color is listed twice
+        for mask_color in reversed(list(self.masks.values())):
+            color_lut[mask_color["source_color"]] = mask_color["target_color"]
+        return color_lut
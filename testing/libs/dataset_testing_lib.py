@@ -1,8 +1,11 @@
 """Library containing functions for testing pipelines."""
 
 import glob
+import json
 import os
+from itertools import zip_longest
 from pathlib import Path
+from typing import Optional
 
 import cv2
 import numpy as np
@@ -74,6 +77,42 @@ class DatasetTestingLibrary:
                 print(f"Expected: {expected_line} \n but found: {current_line}")
         return identical
 
+    @staticmethod
+    def verify_jsonl_files_identical(expected_jsonl_path: str, current_jsonl_path: str) -> bool:
+        """Check if json lines files are identical, reading them line by line and stopping at the first difference."""
+        with open(expected_jsonl_path, "r") as expected_file, open(current_jsonl_path, "r") as current_file:
+            for expected_line, current_line in zip_longest(expected_file, current_file):
+                if expected_line is None or current_line is None:
+                    print(f"Mismatch in number of lines: {expected_jsonl_path}, {current_jsonl_path}")
+                    return False
+                if json.loads(expected_line) != json.loads(current_line):
+                    print(f"Expected: {expected_line} \n but found: {current_line}")
+                    return False
+        return True
+
+    @staticmethod
+    def walk_file_tree(root: str, suffix: Optional[str] = None) -> list:
+        """List paths under root like recursive glob, reusing file types cached by os.scandir instead of calling stat.
+
+        As in glob, hidden files and directories are skipped. Without suffix, the root and all directories are listed too.
+        """
+        if not os.path.isdir(root):
+            return []
+        paths = [] if suffix else [os.path.join(root, "")]
+        directories = [root]
+        while directories:
+            with os.scandir(directories.pop()) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+                        if suffix is None:
+                            paths.append(entry.path)
+                    elif suffix is None or entry.name.endswith(suffix):
+                        paths.append(entry.path)
+        return paths
+
     @staticmethod
     def clean_up(directory_to_erase: Path) -> None:
         """Recursively remove files from directory_to_erase."""
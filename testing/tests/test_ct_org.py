@@ -6,7 +6,6 @@ This test checks whether the Pipeline for CT-ORG dataset runs correctly.
 """
 
 import glob
-import json
 import os
 
 import pytest
@@ -44,8 +43,8 @@ def test_run_ct_org():
 
 def test_ct_org_verify_file_tree():
     """Test to verify if file tree is as expected."""
-    expected_file_tree = glob.glob(f"{str(expected_output_path)}/**", recursive=True)
-    current_file_tree = glob.glob(f"{str(target_path)}/**", recursive=True)
+    expected_file_tree = DatasetTestingLibrary.walk_file_tree(expected_output_path)
+    current_file_tree = DatasetTestingLibrary.walk_file_tree(target_path)
 
     if not DatasetTestingLibrary.verify_file_tree(expected_file_tree, current_file_tree):
         pytest.fail("CT-ORG pipeline created file tree different than expected.")
@@ -53,8 +52,8 @@ def test_ct_org_verify_file_tree():
 
 def test_ct_org_verify_images_correct():
     """Test to verify whether all images have contents as expected."""
-    expected_file_tree = glob.glob(f"{str(expected_output_path)}/**/*.png", recursive=True)
-    current_file_tree = glob.glob(f"{str(target_path)}/**/*.png", recursive=True)
+    expected_file_tree = DatasetTestingLibrary.walk_file_tree(expected_output_path, suffix=".png")
+    current_file_tree = DatasetTestingLibrary.walk_file_tree(target_path, suffix=".png")
 
     if not DatasetTestingLibrary.verify_all_images_identical(expected_file_tree, current_file_tree):
         pytest.fail("CT-ORG pipeline created image contents different than expected.")
@@ -64,13 +63,9 @@ def test_ct_org_verify_jsonl_correct():
     """Test to verify whether all json files have contents as expected."""
     expected_jsonl_path = glob.glob(f"{expected_output_path}/**/**.jsonl", recursive=True)[0]
     current_jsonl_path = glob.glob(f"{target_path}/**/**.jsonl", recursive=True)[0]
-    with open(expected_jsonl_path, "r") as file:
-        expected_jsonl = [json.loads(line) for line in file]
-    with open(current_jsonl_path, "r") as file:
-        current_jsonl = [json.loads(line) for line in file]
 
-    if not DatasetTestingLibrary.verify_jsonl_identical(expected_jsonl, current_jsonl):
-        pytest.fail("Brain Tumor Progression pipeline created jsonl contents different than expected.")
+    if not DatasetTestingLibrary.verify_jsonl_files_identical(expected_jsonl_path, current_jsonl_path):
+        pytest.fail("CT-ORG pipeline created jsonl contents different than expected.")
 
 
 def test_clean_up_ct_org():
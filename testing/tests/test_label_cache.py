@@ -0,0 +1,95 @@
+"""
+test_label_cache.
+
+Objective:
+This test checks whether parsed labels files are cached on disk and parsed again when the labels file changes.
+"""
+
+import os
+import sys
+
+import pytest
+
+from base.extractors import BaseLabelExtractor
+from src.pipelines.chest_xray14 import LabelExtractor
+
+label_module = sys.modules[BaseLabelExtractor.__module__]
+parsed_paths: list = []
+
+
+def count_lines(labels_path: os.PathLike) -> int:
+    """Parse the labels file by counting its lines, recording each call."""
+    parsed_paths.append(labels_path)
+    with open(labels_path, "r") as file:
+        return len(file.readlines())
+
+
+@pytest.fixture
+def labels_path(tmp_path, monkeypatch):
+    """Create a labels file and redirect the labels cache to a temporary directory."""
+    monkeypatch.setattr(label_module, "CACHE_PATH", str(tmp_path / "cache"))
+    monkeypatch.setattr(label_module, "_parsed_labels_files", {})
+    parsed_paths.clear()
+    path = tmp_path / "labels.csv"
+    path.write_text("Image Index,Finding Labels\n00000001_000.png,Cardiomegaly|Effusion\n00000002_000.png,No Finding\n")
+    return str(path)
+
+
+def get_cache_files(dataset_name: str) -> list:
+    """Get files stored in the labels cache of the dataset."""
+    cache_dir = os.path.join(label_module.CACHE_PATH, dataset_name)
+    return os.listdir(cache_dir) if os.path.exists(cache_dir) else []
+
+
+def test_cache_miss_parses_and_stores(labels_path):
+    """Test to verify, that labels are parsed and stored on disk on cache miss."""
+    if BaseLabelExtractor._load_cached("dummy", labels_path, count_lines) != 3:
+        pytest.fail("Labels loaded on cache miss are different than the parsed labels.")
+    if len(parsed_paths) != 1:
+        pytest.fail("Labels file was not parsed on cache miss.")
+    if len(get_cache_files("dummy")) != 1:
+        pytest.fail("Parsed labels were not stored in the cache.")
+
+
+def test_cache_hit_skips_parsing(labels_path):
+    """Test to verify, that cached labels are loaded without parsing the labels file again."""
+    BaseLabelExtractor._load_cached("dummy", labels_path, count_lines)
+    if BaseLabelExtractor._load_cached("dummy", labels_path, count_lines) != 3:
+        pytest.fail("Labels loaded on cache hit are different than the parsed labels.")
+    if len(parsed_paths) != 1:
+        pytest.fail("Labels file was parsed again despite the cache hit.")
+
+
+def test_cache_invalidated_after_mtime_change(labels_path):
+    """Test to verify, that labels are parsed again after the labels file is modified."""
+    BaseLabelExtractor._load_cached("dummy", labels_path, count_lines)
+    stat = os.stat(labels_path)
+    os.utime(labels_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    BaseLabelExtractor._load_cached("dummy", labels_path, count_lines)
+    if len(parsed_paths) != 2:
+        pytest.fail("Labels file was not parsed again after its modification time changed.")
+
+
+def test_corrupted_cache_parses_again(labels_path):
+    """Test to verify, that a corrupted cache file is replaced by parsing the labels file again."""
+    BaseLabelExtractor._load_cached("dummy", labels_path, count_lines)
+    cache_file = os.path.join(label_module.CACHE_PATH, "dummy", get_cache_files("dummy")[0])
+    with open(cache_file, "wb") as file:
+        file.write(b"")
+    if BaseLabelExtractor._load_cached("dummy", labels_path, count_lines) != 3:
+        pytest.fail("Labels loaded from a corrupted cache are different than the parsed labels.")
+    if len(parsed_paths) != 2:
+        pytest.fail("Labels file was not parsed again when the cache was corrupted.")
+
+
+def test_chest_xray14_cache_uses_dataset_name(labels_path):
+    """Test to verify, that the ChestX-ray14 extractor stores its index under the given dataset name."""
+    labels = {"Cardiomegaly": [{"BoxlikeHeart": 1}], "Effusion": [{"PleuralEffusion": 1}], "No Finding": []}
+    extractor = LabelExtractor(labels, labels_path, cache_labels=True, dataset_name="11_chest_xray14_test")
+    if len(get_cache_files("11_chest_xray14_test")) != 1:
+        pytest.fail("ChestX-ray14 index was not stored under the dataset name.")
+    if extractor("00000001_000.png", "") != (
+        [{"BoxlikeHeart": 1}, {"PleuralEffusion": 1}],
+        ["Cardiomegaly", "Effusion"],
+    ):
+        pytest.fail("Labels extracted with the cached index are different than the source labels.")
@@ -0,0 +1,87 @@
+"""
+test_webdataset_backend.
+
+Objective:
+This test checks whether the "webdataset" output backend packs the pipeline output into tar shards correctly.
+The Finding and Measuring Lungs dummy data is used, as each of its images gets a mask.
+"""
+
+import glob
+import json
+import os
+import tarfile
+
+import pytest
+
+from base.pipeline import PathArgs
+from src.pipelines.finding_and_measuring_lungs import FindingAndMeasuringLungsPipeline
+from testing.libs.dataset_testing_lib import DatasetTestingLibrary
+
+source_path = os.path.join(
+    os.getcwd(), "testing/test_dummy_data/05_finding_and_measuring_lungs/input/archive/2d_images"
+)
+masks_path = os.path.join(os.getcwd(), "testing/test_dummy_data/05_finding_and_measuring_lungs/input/archive/2d_masks")
+target_path = os.path.join(os.getcwd(), "testing/test_dummy_data/05_finding_and_measuring_lungs/output_webdataset")
+
+
+def test_initial_clean_up_webdataset_backend():
+    """Removes output folder with it's contents."""
+    DatasetTestingLibrary.clean_up(target_path)
+
+
+def test_unknown_output_backend_raises():
+    """Test to verify, that an unknown output backend fails when the pipeline is created."""
+    with pytest.raises(ValueError):
+        FindingAndMeasuringLungsPipeline(
+            path_args=PathArgs(source_path=source_path, masks_path=masks_path, target_path=target_path),
+            pipeline_args_overrides={"output_backend": "hdf5"},
+        )
+
+
+def test_run_webdataset_backend():
+    """Test to verify, that there are no exceptions while running pipeline with the webdataset backend."""
+    dataset = FindingAndMeasuringLungsPipeline(
+        path_args=PathArgs(source_path=source_path, masks_path=masks_path, target_path=target_path),
+        pipeline_args_overrides={"output_backend": "webdataset"},
+    )
+    pipeline = dataset.pipeline
+    try:
+        pipeline.transform(dataset.args["source_path"])
+    except Exception as e:
+        pytest.fail(f'Trying to run pipeline with the webdataset backend raised an exception: "{e}"')
+
+
+def test_webdataset_backend_verify_shards_correct():
+    """Test to verify whether shards contain the image, mask and jsonl entry of every output image."""
+    jsonl_path = glob.glob(f"{target_path}/**/**.jsonl", recursive=True)[0]
+    with open(jsonl_path, "r") as file:
+        expected_samples = {os.path.splitext(obj["umie_id"])[0]: obj for obj in map(json.loads, file)}
+
+    samples: dict = {}
+    for shard_path in glob.glob(f"{target_path}/**/Shards/*.tar", recursive=True):
+        with tarfile.open(shard_path) as shard:
+            for member in shard.getmembers():
+                key, extension = member.name.split(".", 1)
+                samples.setdefault(key, {})[extension] = shard.extractfile(member).read()
+
+    if samples.keys() != expected_samples.keys():
+        pytest.fail("Shard keys are different than UMIE ids in the jsonl file.")
+    for key, sample in samples.items():
+        obj = expected_samples[key]
+        if json.loads(sample["json"]) != obj:
+            pytest.fail(f"Metadata of {key} is different than its jsonl entry.")
+        with open(os.path.join(target_path, obj["umie_path"]), "rb") as file:
+            if sample["png"] != file.read():
+                pytest.fail(f"Image of {key} is different than the output png file.")
+        if not obj["mask_path"]:
+            if "mask.png" in sample:
+                pytest.fail(f"Sample {key} includes a mask, but the image has none.")
+            continue
+        with open(os.path.join(target_path, obj["mask_path"]), "rb") as file:
+            if sample.get("mask.png") != file.read():
+                pytest.fail(f"Mask of {key} is different than the output mask file.")
+
+
+def test_clean_up_webdataset_backend():
+    """Removes output folder with its contents."""
+    DatasetTestingLibrary.clean_up(target_path)